@@ -10,9 +10,11 @@ Classes:
 	Save: Represents a single UNDERTALE save file with parsed metadata.
 
 Functions:
+	get_save: Get a (cached) Save for a directory.
 	load_config: Load configuration from disk.
 	save_config: Save configuration to disk.
 	list_backups: List all backup directories.
+	get_backup_saves: Get a Save for every backup directory.
 	backup_save: Create a backup of the current game save.
 	load_save: Load a save from a backup.
 """
@@ -29,6 +31,7 @@ import os
 import platform
 import shutil  # noqa
 from datetime import timedelta
+from functools import cached_property, lru_cache
 from pathlib import Path
 
 from undertale_manager.ids import ROOM_IDS  # noqa
@@ -49,107 +52,182 @@ else:
 	exit("Unsupported OS")
 
 
+# Use `orjson` for the config if it's installed, otherwise stick with the standard library
+try:
+	import orjson
+
+	def _dumps(obj) -> bytes:
+		return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+	_loads = orjson.loads
+except ImportError:
+	def _dumps(obj) -> bytes:
+		return json.dumps(obj, indent=2).encode("utf-8")
+
+	_loads = json.loads
+
+
 def load_config() -> dict:
 	"""Load configuration from file."""
 	if CONFIG_FILE.exists():
 		try:
-			with CONFIG_FILE.open("r") as f:
-				return json.load(f)
+			return _loads(CONFIG_FILE.read_bytes())
 		except Exception:
 			pass
 	return {}
 
 
 def save_config(config: dict) -> None:
-	"""Save configuration to file."""
+	"""Save configuration to file.
+	Written to a temporary file first and swapped in, so a crash can't leave a half-written config.
+	"""
 	CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
+	tmp_file = CONFIG_FILE.with_suffix(".json.tmp")
 	try:
-		with CONFIG_FILE.open("w") as f:
-			json.dump(config, f, indent=2)
+		tmp_file.write_bytes(_dumps(config))
+		os.replace(tmp_file, CONFIG_FILE)
 	except Exception:
-		pass
+		# Don't leave the temporary file lying around
+		try:
+			tmp_file.unlink(missing_ok=True)
+		except OSError:
+			pass
 
 
 ############################################
 # SAVE CLASS AND SAVE MANAGEMENT FUNCTIONS #
 ############################################
 
+# Line indices of `file0` that `Save` reads
+_SAVE_LINES = (0, 1, 2, 9, 10, 11, 35, 251, 252, 253, 254, 255, 510, 547, 548)
+_MAX_LINE = max(_SAVE_LINES)
+
+# How far into the game each area is, used for genocide route detection
+_AREA_INDEX = {
+	"error": 0,
+	"ruins": 1,
+	"snowdin": 2,
+	"waterfall": 3,
+	"hotland": 4,
+	"core": 5,
+	"new home": 6,
+}
+
+# Fallback for room IDs that aren't in `ROOM_IDS`
+_EMPTY_ROOM = {}
+
+# `CopyFileExW` flag to copy symlinks as symlinks instead of their targets
+_COPY_FILE_COPY_SYMLINK = 0x800
+
+# Files that mean there's a save in the game save directory
+_GAME_SAVE_FILES = frozenset({"file0", "file9", "undertale.ini"})
+
+
+@lru_cache(maxsize=512)
+def _room_lookup(room_id: int) -> tuple[str, str]:
+	"""Get the name and area of a room, or empty strings if it isn't in `ROOM_IDS`."""
+	room = ROOM_IDS[room_id] if 0 <= room_id < len(ROOM_IDS) else _EMPTY_ROOM
+	return room.get("name", ""), room.get("area", "")
+
+
 class Save:
 	"""Object for save files.
 	Try to process the `file0` file that is usually found in the game save folder.
+	Nothing is read from disk until one of the parsed fields is first accessed.
 	"""
 	def __init__(self, dir_path: os.PathLike):
-		self.path = Path(dir_path).resolve()
+		# No `resolve()`: callers pass absolute paths and it costs a syscall per save
+		self.path = Path(dir_path).absolute()
 		self.TITLE = self.path.name
 
-		# Return early if the save file isn't there 🤡
-		if not self.is_valid():
-			self.NAME = "(Empty Save)"
-			self.FUN = "N/A"
-			self.LOVE = "N/A"
-			self.HP = "N/A"
-			self.GOLD = "N/A"
-			self.EXP = "N/A"
-			self.kills = "N/A"
-			self.room_id = "N/A"
-			self.room_name = "N/A"
-			self.room_area = "N/A"
-			self.genocide = "N/A"
-			self.data = []
-			return
+	@cached_property
+	def _file0(self) -> Path:
+		return self.path / "file0"
 
-		with (self.path / "file0").open() as save_file:
-			data = save_file.readlines()
-
-		self.NAME = data[0].strip()
-		self.FUN = data[35].strip()
-		self.LOVE = data[1].strip()
-		self.HP = data[2].strip()
-		self.GOLD = data[10].strip()
-		self.EXP = data[9].strip()
-		self.kills = data[11].strip()
-		self.room_id = data[547].strip()
-		self.room_name = ROOM_IDS[int(self.room_id)].get("name", "")
-		self.room_area = ROOM_IDS[int(self.room_id)].get("area", "")
-		self.playtime = timedelta(seconds=round(int(data[548].strip())/30))
-		self.data = data
-
-		match self.room_area.lower():
-			case "error":
-				current_area = 0
-			case "ruins":
-				current_area = 1
-			case "snowdin":
-				current_area = 2
-			case "waterfall":
-				current_area = 3
-			case "hotland":
-				current_area = 4
-			case "core":
-				current_area = 5
-			case "new home":
-				current_area = 6
-			case _:
-				current_area = 7
-
-		genocide_areas = []
-
-		if current_area >= 1:
-			genocide_areas.append(True if data[251].strip() == "1" else False)
-		if current_area >= 2:
-			genocide_areas.append(True if data[252].strip() == "1" else False)
-		if current_area >= 3:
-			genocide_areas.append(True if data[253].strip() == "1" else False)
-		if current_area >= 4:
-			genocide_areas.append(True if data[254].strip() == "1" or data[255].strip() == "1" else False)
-		if current_area >= 6:
-			genocide_areas.append(int(self.LOVE) >= 19)
-
-		self.genocide = all(genocide_areas) or data[510].strip() == "1"
+	@cached_property
+	def _data(self) -> dict[int, bytes]:
+		"""Stripped lines of `file0` that are actually used, or an empty dict if the save file isn't there 🤡"""
+		if not self.is_valid():
+			return {}
+
+		# Read raw bytes and only split as far as the last line we need,
+		# then keep just the lines in `_SAVE_LINES` so the rest can be freed right away
+		raw = self._file0.read_bytes()
+		lines = raw.split(b"\n", _MAX_LINE + 1)
+		return {index: lines[index].strip() for index in _SAVE_LINES}
+
+	def _field(self, index: int) -> str:
+		"""Get line `index` of `file0` as a string, or "N/A" for empty saves."""
+		return self._data[index].decode() if self._data else "N/A"
+
+	@cached_property
+	def NAME(self) -> str:
+		return self._field(0) if self._data else "(Empty Save)"
+
+	@cached_property
+	def FUN(self) -> str:
+		return self._field(35)
+
+	@cached_property
+	def LOVE(self) -> str:
+		return self._field(1)
+
+	@cached_property
+	def HP(self) -> str:
+		return self._field(2)
+
+	@cached_property
+	def GOLD(self) -> str:
+		return self._field(10)
+
+	@cached_property
+	def EXP(self) -> str:
+		return self._field(9)
+
+	@cached_property
+	def kills(self) -> str:
+		return self._field(11)
+
+	@cached_property
+	def room_id(self) -> str:
+		return self._field(547)
+
+	@cached_property
+	def room_name(self) -> str:
+		return _room_lookup(int(self.room_id))[0] if self._data else "N/A"
+
+	@cached_property
+	def room_area(self) -> str:
+		return _room_lookup(int(self.room_id))[1] if self._data else "N/A"
+
+	@cached_property
+	def playtime(self) -> timedelta | str:
+		return timedelta(seconds=int(self._field(548)) // 30) if self._data else "N/A"  # Stored in frames (30 FPS)
+
+	@cached_property
+	def genocide(self) -> bool | str:
+		"""Whether every area visited so far was cleared out (or the genocide flag is set)."""
+		data = self._data
+		if not data:
+			return "N/A"
+
+		current_area = _AREA_INDEX.get(self.room_area.lower(), 7)
+
+		# One check per area (CORE has none), only the first `current_area` of them apply
+		area_checks = (
+			data[251] == b"1",  # RUINS
+			data[252] == b"1",  # Snowdin
+			data[253] == b"1",  # Waterfall
+			data[254] == b"1" or data[255] == b"1",  # Hotland
+			True,  # CORE
+			current_area < 6 or int(self.LOVE) >= 19,  # New Home
+		)
+
+		return all(area_checks[:current_area]) or data[510] == b"1"
 
 	def is_valid(self) -> bool:
 		"""Check if this save has valid data (not empty)."""
-		return (self.path / "file0").exists()
+		return self._file0.exists()
 
 	def __repr__(self):
 		return f"""{self.NAME}
@@ -162,10 +240,59 @@ class Save:
 >	FUN: {self.FUN}"""
 
 
+@lru_cache(maxsize=256)
+def _cached_save(path: str, mtime_ns: int) -> Save:
+	"""Build a Save, memoized on its path and the mtime of its `file0`."""
+	return Save(path)
+
+
+def get_save(dir_path: os.PathLike) -> Save:
+	"""Get a Save for the given directory, reusing the parsed one if `file0` hasn't changed."""
+	try:
+		mtime_ns = (Path(dir_path) / "file0").stat().st_mtime_ns
+	except OSError:
+		return Save(dir_path)  # Empty saves are cheap, don't bother caching them
+	return _cached_save(str(dir_path), mtime_ns)
+
+
 def list_backups(backup_dir: Path):
 	"""List all backup directories in the given backup directory."""
-	backup_dir = Path(backup_dir)
-	return [f for f in backup_dir.iterdir() if f.is_dir()]
+	# `DirEntry.is_dir()` reuses the info from the directory listing instead of a `stat()` per entry
+	with os.scandir(backup_dir) as entries:
+		return [Path(entry.path) for entry in entries if entry.is_dir()]
+
+
+def get_backup_saves(backup_dir: Path) -> list[Save]:
+	"""Get a Save for every backup directory."""
+	return [get_save(path) for path in list_backups(backup_dir)]
+
+
+def _copy_file(src: os.PathLike, dst: os.PathLike, *, follow_symlinks=True):
+	"""Copy a file and its metadata, using the native `CopyFileExW` on Windows.
+	Same signature as `shutil.copy2`: `dst` may be a directory, and with `follow_symlinks=False`
+	a symlink is copied as a symlink (`COPY_FILE_COPY_SYMLINK` on Windows).
+	"""
+	if system != "Windows":
+		return shutil.copy2(src, dst, follow_symlinks=follow_symlinks)
+
+	import ctypes
+
+	if os.path.isdir(dst):
+		dst = os.path.join(dst, os.path.basename(src))
+	flags = 0 if follow_symlinks else _COPY_FILE_COPY_SYMLINK
+	if not ctypes.windll.kernel32.CopyFileExW(os.fspath(src), os.fspath(dst), None, None, None, flags):
+		raise ctypes.WinError()
+	return dst
+
+
+def _clear_game_save_dir():
+	"""Remove everything inside the game save directory (but not the directory itself, it may be a symlink)."""
+	with os.scandir(GAME_SAVE_DIR) as entries:
+		for entry in entries:
+			if entry.is_dir(follow_symlinks=False):
+				shutil.rmtree(entry.path)
+			else:
+				os.unlink(entry.path)
 
 
 def backup_save(name, backup_dir: Path, rm=False):
@@ -173,14 +300,10 @@ def backup_save(name, backup_dir: Path, rm=False):
 	backup_path = Path(backup_dir) / name
 	backup_path.mkdir(parents=True, exist_ok=True)
 
-	shutil.copytree(GAME_SAVE_DIR, backup_path, dirs_exist_ok=True)
+	shutil.copytree(GAME_SAVE_DIR, backup_path, dirs_exist_ok=True, copy_function=_copy_file)
 
 	if rm:
-		for item in GAME_SAVE_DIR.iterdir():
-			if item.is_dir():
-				shutil.rmtree(item)
-			else:
-				item.unlink()
+		_clear_game_save_dir()
 
 	print(f"Backup '{name}' created.")
 
@@ -193,22 +316,25 @@ def load_save(path: os.PathLike, rm=False):
 		print(f"Backup '{path.name}' does not exist.")
 		return
 
-	if (GAME_SAVE_DIR / "file0").exists() or (GAME_SAVE_DIR / "file9").exists() or (GAME_SAVE_DIR / "undertale.ini").exists():
+	# List the game save dir once instead of checking each file separately
+	try:
+		with os.scandir(GAME_SAVE_DIR) as entries:
+			current_files = {entry.name for entry in entries}
+	except FileNotFoundError:
+		current_files = set()
+
+	if not current_files.isdisjoint(_GAME_SAVE_FILES):
 		if rm:
-			for item in GAME_SAVE_DIR.iterdir():
-				if item.is_dir():
-					shutil.rmtree(item)
-				else:
-					item.unlink()
+			_clear_game_save_dir()
 		else:
 			print("Current save exists. Use rm=True to overwrite.")
 			return
 
 	for item in path.iterdir():
 		if item.is_dir():
-			shutil.copytree(item, GAME_SAVE_DIR / item.name, dirs_exist_ok=True)
+			shutil.copytree(item, GAME_SAVE_DIR / item.name, dirs_exist_ok=True, copy_function=_copy_file)
 		else:
-			shutil.copy(item, GAME_SAVE_DIR / item.name)
+			_copy_file(item, GAME_SAVE_DIR / item.name)
 
 	print(f"Backup '{path.name}' loaded.")
 
@@ -18,7 +18,7 @@ from textual.containers import Horizontal, Vertical, Container
 from textual.screen import ModalScreen
 from textual.widgets import Button, DirectoryTree, Footer, Header, Input, Label, ListItem, ListView, Static, Rule
 
-from undertale_manager import GAME_SAVE_DIR, Save, __version__, backup_save, list_backups, load_config, load_save, save_config # noqa
+from undertale_manager import GAME_SAVE_DIR, Save, __version__, backup_save, get_backup_saves, load_config, load_save, save_config # noqa
 
 
 #############
@@ -31,6 +31,7 @@ class UndertaleManagerApp(App):
 
 	def __init__(self, backup_dir: Optional[PathLike] = None):
 		super().__init__()
+		self._refresh_pending = False
 		if backup_dir:
 			self.backup_dir = Path(backup_dir).resolve()
 		else:
@@ -96,6 +97,16 @@ class UndertaleManagerApp(App):
 			self.run_worker(self.choose_directory())
 
 	def refresh_save_list(self) -> None:
+		"""Schedule a refresh of the save list.
+		Requests made before it runs are merged into one, which lists the backups as they are by then.
+		"""
+		if self._refresh_pending:
+			return
+		self._refresh_pending = True
+		self.call_after_refresh(self._refresh_save_list)
+
+	def _refresh_save_list(self) -> None:
+		self._refresh_pending = False
 		if not self.backup_dir:
 			return
 		try:
@@ -105,8 +116,8 @@ class UndertaleManagerApp(App):
 			# No SaveListView yet, mount it
 			self.mount(SaveListView(self.backup_dir), before="#main-buttons")
 			return
-		for save in list_backups(self.backup_dir):
-			save_list_view.append(SaveWidget(Save(save)))
+		for save in get_backup_saves(self.backup_dir):
+			save_list_view.append(SaveWidget(save))
 
 
 #############################
@@ -162,6 +173,19 @@ class BackupDirectoryScreen(ModalScreen[Path]):
 						pass  # Stay on screen if creation fails
 
 
+# Color used for each area name in the save details
+_AREA_COLORS = {
+	"ruins": "magenta",
+	"waterfall": "blue",
+	"snowdin": "white",
+	"hotland": "grey",
+	"core": "cyan",
+	"new home": "tan",
+	"true lab": "green",
+	"error": "red",
+}
+
+
 class SaveDetailScreen(ModalScreen[None]):
 	"""Modal popup that shows the details of a selected save."""
 
@@ -172,25 +196,7 @@ class SaveDetailScreen(ModalScreen[None]):
 		self.save = save
 
 	def compose(self) -> ComposeResult:
-		match self.save.room_area.lower():
-			case "ruins":
-				room_color = "magenta"
-			case "waterfall":
-				room_color = "blue"
-			case "snowdin":
-				room_color = "white"
-			case "hotland":
-				room_color = "grey"
-			case "core":
-				room_color = "cyan"
-			case "new home":
-				room_color = "tan"
-			case "true lab":
-				room_color = "green"
-			case "error":
-				room_color = "red"
-			case _:
-				room_color = "black"
+		room_color = _AREA_COLORS.get(self.save.room_area.lower(), "black")
 
 		yield Header()
 		yield Vertical(
@@ -285,11 +291,11 @@ class BackupNameScreen(ModalScreen[None]):
 class SaveListView(ListView):
 	def __init__(self, backup_dir: PathLike):
 		super().__init__()
-		self.backup_dir = Path(backup_dir).resolve()
+		self.backup_dir = Path(backup_dir).absolute()  # Already resolved by the app
 
 	def compose(self):
-		for save in list_backups(self.backup_dir):
-			yield SaveWidget(Save(save))
+		for save in get_backup_saves(self.backup_dir):
+			yield SaveWidget(save)
 
 	def on_list_view_selected(self, event: ListView.Selected) -> None:
 		if isinstance(event.item, SaveWidget):
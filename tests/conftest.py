@@ -0,0 +1,14 @@
+"""Pytest configuration for UNDERTALE Save Manager tests."""
+
+import pytest
+
+
+def pytest_configure(config):
+	"""Check that the version is correctly set once, while the package is imported anyway."""
+	try:
+		import undertale_manager
+	except (Exception, SystemExit) as e:  # The package exits on unsupported OSes
+		pytest.exit(f"Could not import undertale_manager: {e}", returncode=1)
+
+	if undertale_manager.__version__ != "1.0.0":
+		pytest.exit(f"Unexpected undertale_manager version: {undertale_manager.__version__}", returncode=1)
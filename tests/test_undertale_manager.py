@@ -1,79 +1,233 @@
 """Unit tests for UNDERTALE Save Manager."""
 
+import asyncio
+import ctypes
 import json
+import os
+from datetime import timedelta
 from pathlib import Path
-from unittest.mock import patch
+from types import MappingProxyType
+
+import pytest
 
 from undertale_manager import (
 	ROOM_IDS,
 	Save,
+	_copy_file,
 	backup_save,
+	get_backup_saves,
+	get_save,
 	list_backups,
 	load_config,
 	load_save,
 	save_config,
 )
-from undertale_manager import __version__
+from undertale_manager.tui import SaveWidget, UndertaleManagerApp
+
+# Line indices of the `file0` fields used in the tests
+_SAVE_FIELDS = {
+	"name": 0,
+	"love": 1,
+	"hp": 2,
+	"exp": 9,
+	"gold": 10,
+	"kills": 11,
+	"fun": 35,
+	"genocide_ruins": 251,
+	"genocide_snowdin": 252,
+	"genocide_waterfall": 253,
+	"genocide_hotland": 254,
+	"genocide_flag": 510,
+	"room_id": 547,
+	"playtime": 548,
+}
+
+# Every line of the default save is "0", so line `i` starts at byte `2 * i`
+_DEFAULT_SAVE = b"0\n" * 601
+
+
+def _write_save(save_dir: Path, **fields: str) -> Path:
+	"""Write a `file0` to `save_dir` (creating it if needed) from the default save with `fields` overridden."""
+	save = bytearray(_DEFAULT_SAVE)
+	# Replace the highest lines first so the offsets of the lower ones don't shift
+	for index, value in sorted(((_SAVE_FIELDS[field], value) for field, value in fields.items()), reverse=True):
+		save[2 * index:2 * index + 1] = value.encode()
+
+	save_dir.mkdir(parents=True, exist_ok=True)
+	file0 = save_dir / "file0"
+	file0.write_bytes(save)
+	return file0
+
+
+def _make_dirs(*paths: Path) -> None:
+	"""Create directories deepest first, skipping any that were already created as a parent of another."""
+	created = set()
+	for path in sorted(paths, key=lambda path: len(path.parts), reverse=True):
+		if path not in created:
+			path.mkdir(parents=True, exist_ok=True)
+			created.update(path.parents)
+
+
+def _was_printed(printed: list[str], text: str) -> bool:
+	"""Check whether `text` is part of any message collected by the `printed` fixture."""
+	return any(text in message for message in printed)
+
+
+@pytest.fixture
+def printed(monkeypatch) -> list[str]:
+	"""Collect the messages `undertale_manager` prints instead of writing them to stdout."""
+	messages = []
+	monkeypatch.setattr(
+		"undertale_manager.print",
+		lambda *args, **kwargs: messages.append(" ".join(map(str, args))),
+		raising=False,
+	)
+	return messages
+
+
+# Session-scoped saves for tests that only read them (don't modify these!)
+
+@pytest.fixture(scope="session")
+def valid_save_dir(tmp_path_factory):
+	"""Valid save in RUINS with some stats filled in."""
+	save_dir = tmp_path_factory.mktemp("saves") / "valid_save"
+	_write_save(
+		save_dir,
+		name="Frisk",
+		love="5",
+		hp="20",
+		exp="100",
+		gold="500",
+		kills="10",
+		fun="50",
+		room_id="4",  # Beginning in RUINS
+		playtime="900",  # 30 seconds
+	)
+	return save_dir
+
+
+@pytest.fixture(scope="session")
+def genocide_save_dir(tmp_path_factory):
+	"""Save in RUINS with the RUINS genocide flag set."""
+	save_dir = tmp_path_factory.mktemp("saves") / "genocide_save"
+	_write_save(save_dir, name="Chara", love="10", genocide_ruins="1", room_id="4")
+	return save_dir
+
+
+@pytest.fixture(scope="session")
+def pacifist_save_dir(tmp_path_factory):
+	"""Save in RUINS with no kills and no genocide flags."""
+	save_dir = tmp_path_factory.mktemp("saves") / "pacifist_save"
+	_write_save(save_dir, name="Frisk", love="1", kills="0", genocide_ruins="0", room_id="4")
+	return save_dir
+
+
+@pytest.fixture(scope="session")
+def _canonical_game_save(tmp_path_factory):
+	"""Game save contents written once per session, to be linked into each test's `game_save_dir`."""
+	source_dir = tmp_path_factory.mktemp("canonical_game_save")
+	(source_dir / "file0").write_bytes(b"save data")
+	(source_dir / "undertale.ini").write_bytes(b"config")
+	return source_dir
+
+
+@pytest.fixture
+def game_save_dir(tmp_path, _canonical_game_save):
+	"""Per-test game save directory, hard-linked from the canonical one.
+	Deleting or replacing files here only drops this test's links, so the canonical files stay intact.
+	"""
+	save_dir = tmp_path / "game_save"
+	save_dir.mkdir()
+	for source in _canonical_game_save.iterdir():
+		(save_dir / source.name).hardlink_to(source)
+	return save_dir
 
 
-def test_version():
-	"""Test that version is correctly set."""
-	assert __version__ == "1.0.0"
+# Config Tests
 
+# Read-only test configs, serialized once
+_CONFIG = MappingProxyType({"backup_dir": "/test/path"})
+_CONFIG_JSON = json.dumps(dict(_CONFIG)).encode()
+_CONFIG_WITH_SETTING = MappingProxyType({"backup_dir": "/test/path", "setting": "value"})
 
-# Config Tests
 
-def test_load_config_existing_file(tmp_path):
+def test_load_config_existing_file(tmp_path, monkeypatch):
 	"""Test loading config from existing file."""
 	config_file = tmp_path / "config.json"
-	test_config = {"backup_dir": "/test/path"}
-	config_file.write_text(json.dumps(test_config))
+	config_file.write_bytes(_CONFIG_JSON)
 
-	with patch("undertale_manager.CONFIG_FILE", config_file):
-		result = load_config()
-		assert result == test_config
+	monkeypatch.setattr("undertale_manager.CONFIG_FILE", config_file)
+	result = load_config()
+	assert result == _CONFIG
 
 
-def test_load_config_missing_file():
+def test_load_config_missing_file(monkeypatch):
 	"""Test loading config when file doesn't exist."""
-	with patch("undertale_manager.CONFIG_FILE", Path("/nonexistent/config.json")):
-		result = load_config()
-		assert result == {}
+	monkeypatch.setattr("undertale_manager.CONFIG_FILE", Path("/nonexistent/config.json"))
+	result = load_config()
+	assert result == {}
 
 
-def test_load_config_invalid_json(tmp_path):
+def test_load_config_invalid_json(tmp_path, monkeypatch):
 	"""Test loading config with invalid JSON."""
 	config_file = tmp_path / "config.json"
-	config_file.write_text("invalid json{")
+	config_file.write_bytes(b"invalid json{")
 
-	with patch("undertale_manager.CONFIG_FILE", config_file):
-		result = load_config()
-		assert result == {}
+	monkeypatch.setattr("undertale_manager.CONFIG_FILE", config_file)
+	result = load_config()
+	assert result == {}
 
 
-def test_save_config(tmp_path):
+def test_save_config(tmp_path, monkeypatch):
 	"""Test saving config to file."""
 	config_file = tmp_path / "config.json"
-	test_config = {"backup_dir": "/test/path", "setting": "value"}
 
-	with patch("undertale_manager.CONFIG_FILE", config_file):
-		save_config(test_config)
+	monkeypatch.setattr("undertale_manager.CONFIG_FILE", config_file)
+	save_config(dict(_CONFIG_WITH_SETTING))
+
+	assert config_file.exists()
+	loaded = json.loads(config_file.read_bytes())
+	assert loaded == _CONFIG_WITH_SETTING
+
+
+def test_save_config_overwrites_atomically(tmp_path, monkeypatch):
+	"""Test that save_config replaces an existing config and leaves no temp file behind."""
+	config_file = tmp_path / "config.json"
+	config_file.write_bytes(_CONFIG_JSON)
+
+	monkeypatch.setattr("undertale_manager.CONFIG_FILE", config_file)
+	save_config({"backup_dir": "/new/path"})
 
-		assert config_file.exists()
-		loaded = json.loads(config_file.read_text())
-		assert loaded == test_config
+	assert json.loads(config_file.read_bytes()) == {"backup_dir": "/new/path"}
+	assert list(tmp_path.iterdir()) == [config_file]
 
 
-def test_save_config_creates_directory(tmp_path):
+def test_save_config_failure_removes_temp_file(tmp_path, monkeypatch):
+	"""Test that a failed save_config keeps the old config and leaves no temp file behind."""
+	config_file = tmp_path / "config.json"
+	config_file.write_bytes(_CONFIG_JSON)
+
+	def failing_replace(src, dst):
+		raise PermissionError("config is locked")
+
+	monkeypatch.setattr("undertale_manager.CONFIG_FILE", config_file)
+	monkeypatch.setattr("undertale_manager.os.replace", failing_replace)
+	save_config({"backup_dir": "/new/path"})
+
+	assert config_file.read_bytes() == _CONFIG_JSON
+	assert list(tmp_path.iterdir()) == [config_file]
+
+
+def test_save_config_creates_directory(tmp_path, monkeypatch):
 	"""Test that save_config creates parent directory."""
 	config_file = tmp_path / "nested" / "dirs" / "config.json"
 	test_config = {"key": "value"}
 
-	with patch("undertale_manager.CONFIG_FILE", config_file):
-		save_config(test_config)
+	monkeypatch.setattr("undertale_manager.CONFIG_FILE", config_file)
+	save_config(test_config)
 
-		assert config_file.parent.exists()
-		assert config_file.exists()
+	assert config_file.parent.exists()
+	assert config_file.exists()
 
 
 # Save Class Tests
@@ -97,31 +251,9 @@ def test_save_invalid_empty_save(tmp_path):
 	assert save.is_valid() is False
 
 
-def test_save_valid_save_file(tmp_path):
+def test_save_valid_save_file(valid_save_dir):
 	"""Test Save object with valid save file."""
-	save_dir = tmp_path / "valid_save"
-	save_dir.mkdir()
-
-	# Create mock save data (548+ lines)
-	save_data = ["Frisk"] + ["0"] * 600
-	save_data[1] = "5"  # LOVE
-	save_data[2] = "20"  # HP
-	save_data[9] = "100"  # EXP
-	save_data[10] = "500"  # GOLD
-	save_data[11] = "10"  # kills
-	save_data[35] = "50"  # FUN
-	save_data[251] = "0"  # genocide_ruins
-	save_data[252] = "0"  # genocide_snowdin
-	save_data[253] = "0"  # genocide_waterfall
-	save_data[254] = "0"  # genocide_hotland
-	save_data[510] = "0"  # genocide flag
-	save_data[547] = "4"  # room_id (Beginning in RUINS)
-	save_data[548] = "900"  # playtime (30 seconds)
-
-	file0 = save_dir / "file0"
-	file0.write_text("\n".join(save_data))
-
-	save = Save(save_dir)
+	save = Save(valid_save_dir)
 
 	assert save.TITLE == "valid_save"
 	assert save.NAME == "Frisk"
@@ -134,102 +266,113 @@ def test_save_valid_save_file(tmp_path):
 	assert save.room_id == "4"
 	assert save.room_name == "Beginning"
 	assert save.room_area == "RUINS"
+	assert save.playtime == timedelta(seconds=30)
 	assert save.is_valid() is True
 
 
-def test_save_genocide_detection_ruins(tmp_path):
+@pytest.mark.parametrize(
+	("save_dir_fixture", "expected"),
+	[
+		("genocide_save_dir", True),  # RUINS genocide flag set
+		("pacifist_save_dir", False),  # Pacifist/neutral, no kills
+	],
+)
+def test_save_genocide_detection(request, save_dir_fixture, expected):
 	"""Test genocide route detection in RUINS."""
-	save_dir = tmp_path / "genocide_save"
-	save_dir.mkdir()
+	save = Save(request.getfixturevalue(save_dir_fixture))
 
-	save_data = ["Chara"] + ["0"] * 600
-	save_data[1] = "10"
-	save_data[251] = "1"  # genocide_ruins flag
-	save_data[510] = "0"
-	save_data[547] = "4"  # RUINS
-	save_data[548] = "0"
+	assert save.genocide is expected
 
-	file0 = save_dir / "file0"
-	file0.write_text("\n".join(save_data))
+
+def test_save_unknown_room_id(tmp_path):
+	"""Test Save with a room ID that isn't in ROOM_IDS."""
+	save_dir = tmp_path / "unknown_room_save"
+	_write_save(save_dir, room_id="9999")
 
 	save = Save(save_dir)
 
-	assert save.genocide is True
+	assert save.room_id == "9999"
+	assert save.room_name == ""
+	assert save.room_area == ""
 
 
-def test_save_non_genocide_route(tmp_path):
-	"""Test non-genocide (pacifist/neutral) route detection."""
-	save_dir = tmp_path / "pacifist_save"
-	save_dir.mkdir()
+def test_save_fields_parsed_lazily(valid_save_dir, monkeypatch):
+	"""Test that file0 isn't read until a parsed field is accessed."""
+	reads = []
+	read_bytes = Path.read_bytes
+	monkeypatch.setattr(Path, "read_bytes", lambda path: reads.append(path) or read_bytes(path))
 
-	save_data = ["Frisk"] + ["0"] * 600
-	save_data[1] = "1"  # LOVE 1
-	save_data[11] = "0"  # No kills
-	save_data[251] = "0"
-	save_data[510] = "0"
-	save_data[547] = "4"
-	save_data[548] = "0"
+	save = Save(valid_save_dir)
+	assert save.TITLE == "valid_save"
+	assert reads == []
 
-	file0 = save_dir / "file0"
-	file0.write_text("\n".join(save_data))
+	assert save.NAME == "Frisk"
+	assert save.room_area == "RUINS"
+	assert reads == [valid_save_dir / "file0"]
 
-	save = Save(save_dir)
 
-	assert save.genocide is False
+def test_save_repr(valid_save_dir):
+	"""Test Save string representation."""
+	save = Save(valid_save_dir)
+	repr_str = repr(save)
 
+	assert "Frisk" in repr_str
+	assert "LOVE: 5" in repr_str
+	assert "HP: 20" in repr_str
+	assert "GOLD: 500" in repr_str
+	assert "EXP: 100" in repr_str
+	assert "Kills: 10" in repr_str
+	assert "Room: RUINS/Beginning (#4)" in repr_str
+	assert "FUN: 50" in repr_str
 
-def test_save_repr(tmp_path):
-	"""Test Save string representation."""
-	save_dir = tmp_path / "test_save"
-	save_dir.mkdir()
 
-	save_data = ["TestName"] + ["0"] * 600
-	save_data[1] = "3"
-	save_data[2] = "25"
-	save_data[9] = "50"
-	save_data[10] = "250"
-	save_data[11] = "5"
-	save_data[35] = "75"
-	save_data[547] = "10"
-	save_data[548] = "0"
+def test_get_save_cached_until_modified(tmp_path):
+	"""Test that get_save reuses the parsed Save until file0 changes."""
+	save_dir = tmp_path / "cached_save"
+	file0 = _write_save(save_dir, name="Frisk", room_id="4")
+	os.utime(file0, ns=(1_000_000_000, 1_000_000_000))
 
-	file0 = save_dir / "file0"
-	file0.write_text("\n".join(save_data))
+	save = get_save(save_dir)
+	assert get_save(save_dir) is save
 
-	save = Save(save_dir)
-	repr_str = repr(save)
+	_write_save(save_dir, name="Chara", room_id="4")
+	os.utime(file0, ns=(2_000_000_000, 2_000_000_000))
+
+	new_save = get_save(save_dir)
+	assert new_save is not save
+	assert new_save.NAME == "Chara"
+
+
+def test_get_save_empty_save(tmp_path):
+	"""Test get_save with a directory that has no file0."""
+	empty_dir = tmp_path / "empty_save"
+	empty_dir.mkdir()
 
-	assert "TestName" in repr_str
-	assert "LOVE: 3" in repr_str
-	assert "HP: 25" in repr_str
-	assert "GOLD: 250" in repr_str
-	assert "EXP: 50" in repr_str
-	assert "Kills: 5" in repr_str
-	assert "FUN: 75" in repr_str
+	save = get_save(empty_dir)
+
+	assert save.is_valid() is False
+	assert save.NAME == "(Empty Save)"
 
 
 # Backup Management Tests
 
+_BACKUP_NAMES = ("backup1", "backup2", "backup3")
+
+
 def test_list_backups(tmp_path):
 	"""Test listing backup directories."""
 	backup_dir = tmp_path / "backups"
-	backup_dir.mkdir()
 
 	# Create some backup directories
-	(backup_dir / "backup1").mkdir()
-	(backup_dir / "backup2").mkdir()
-	(backup_dir / "backup3").mkdir()
+	_make_dirs(*(backup_dir / name for name in _BACKUP_NAMES))
 
 	# Create a file (should be ignored)
-	(backup_dir / "not_a_backup.txt").write_text("test")
+	(backup_dir / "not_a_backup.txt").write_bytes(b"test")
 
 	backups = list_backups(backup_dir)
 
-	assert len(backups) == 3
-	backup_names = [b.name for b in backups]
-	assert "backup1" in backup_names
-	assert "backup2" in backup_names
-	assert "backup3" in backup_names
+	assert len(backups) == len(_BACKUP_NAMES)
+	assert {b.name for b in backups} == set(_BACKUP_NAMES)
 
 
 def test_list_backups_empty_directory(tmp_path):
@@ -242,40 +385,39 @@ def test_list_backups_empty_directory(tmp_path):
 	assert len(backups) == 0
 
 
-def test_backup_save(tmp_path, capsys):
-	"""Test creating a backup of game save."""
-	game_save_dir = tmp_path / "game_save"
-	game_save_dir.mkdir()
-	(game_save_dir / "file0").write_text("save data")
-	(game_save_dir / "undertale.ini").write_text("config")
-
+def test_get_backup_saves(tmp_path):
+	"""Test getting a Save for every backup directory."""
 	backup_dir = tmp_path / "backups"
-	backup_dir.mkdir()
+	_make_dirs(backup_dir / "backup1", backup_dir / "backup2")
+	(backup_dir / "not_a_backup.txt").write_bytes(b"test")
+
+	saves = get_backup_saves(backup_dir)
+
+	assert all(isinstance(save, Save) for save in saves)
+	assert sorted(save.TITLE for save in saves) == ["backup1", "backup2"]
+
+
+def test_backup_save(tmp_path, game_save_dir, monkeypatch, printed):
+	"""Test creating a backup of game save."""
+	backup_dir = tmp_path / "backups"  # Created by backup_save
 
-	with patch("undertale_manager.GAME_SAVE_DIR", game_save_dir):
-		backup_save("test_backup", backup_dir)
+	monkeypatch.setattr("undertale_manager.GAME_SAVE_DIR", game_save_dir)
+	backup_save("test_backup", backup_dir)
 
 	backup_path = backup_dir / "test_backup"
 	assert backup_path.exists()
 	assert (backup_path / "file0").exists()
 	assert (backup_path / "undertale.ini").exists()
 
-	captured = capsys.readouterr()
-	assert "Backup 'test_backup' created" in captured.out
+	assert _was_printed(printed, "Backup 'test_backup' created")
 
 
-def test_backup_save_with_rm(tmp_path, capsys):
+def test_backup_save_with_rm(tmp_path, game_save_dir, monkeypatch, printed):
 	"""Test creating a backup and removing original."""
-	game_save_dir = tmp_path / "game_save"
-	game_save_dir.mkdir()
-	(game_save_dir / "file0").write_text("save data")
-	(game_save_dir / "undertale.ini").write_text("config")
+	backup_dir = tmp_path / "backups"  # Created by backup_save
 
-	backup_dir = tmp_path / "backups"
-	backup_dir.mkdir()
-
-	with patch("undertale_manager.GAME_SAVE_DIR", game_save_dir):
-		backup_save("test_backup", backup_dir, rm=True)
+	monkeypatch.setattr("undertale_manager.GAME_SAVE_DIR", game_save_dir)
+	backup_save("test_backup", backup_dir, rm=True)
 
 	# Backup should exist
 	backup_path = backup_dir / "test_backup"
@@ -286,81 +428,180 @@ def test_backup_save_with_rm(tmp_path, capsys):
 	assert not (game_save_dir / "file0").exists()
 	assert not (game_save_dir / "undertale.ini").exists()
 
+	assert _was_printed(printed, "Backup 'test_backup' created")
 
-def test_load_save(tmp_path, capsys):
-	"""Test loading a save from backup."""
-	backup_path = tmp_path / "backups" / "test_backup"
-	backup_path.mkdir(parents=True)
-	(backup_path / "file0").write_text("backup save data")
-	(backup_path / "file9").write_text("system info")
 
-	game_save_dir = tmp_path / "game_save"
-	game_save_dir.mkdir()
+class _FakeKernel32:
+	"""Stand-in for `ctypes.windll.kernel32` that records `CopyFileExW` calls."""
 
-	with patch("undertale_manager.GAME_SAVE_DIR", game_save_dir):
-		load_save(backup_path)
+	def __init__(self, result: int):
+		self.result = result
+		self.calls = []
 
-	assert (game_save_dir / "file0").exists()
-	assert (game_save_dir / "file9").exists()
-	assert (game_save_dir / "file0").read_text() == "backup save data"
+	def CopyFileExW(self, *args):
+		self.calls.append(args)
+		return self.result
 
-	captured = capsys.readouterr()
-	assert "Backup 'test_backup' loaded" in captured.out
 
+@pytest.fixture
+def fake_windows_copy(monkeypatch):
+	"""Make `_copy_file` take its Windows path, with a fake `CopyFileExW` (returning success by default)."""
+	kernel32 = _FakeKernel32(result=1)
+	monkeypatch.setattr("undertale_manager.system", "Windows")
+	monkeypatch.setattr(ctypes, "windll", type("windll", (), {"kernel32": kernel32}), raising=False)
+	monkeypatch.setattr(ctypes, "WinError", lambda: OSError("CopyFileExW failed"), raising=False)
+	return kernel32
 
-def test_load_save_nonexistent(tmp_path, capsys):
-	"""Test loading from non-existent backup."""
-	backup_path = tmp_path / "backups" / "nonexistent"
-	game_save_dir = tmp_path / "game_save"
-	game_save_dir.mkdir()
 
-	with patch("undertale_manager.GAME_SAVE_DIR", game_save_dir):
-		load_save(backup_path)
+def test_copy_file_windows_into_directory(tmp_path, fake_windows_copy):
+	"""Test that the Windows copy joins the file name onto a directory destination."""
+	src = tmp_path / "file0"
+	src.write_bytes(b"save data")
+	dst_dir = tmp_path / "backup"
+	dst_dir.mkdir()
 
-	captured = capsys.readouterr()
-	assert "does not exist" in captured.out
+	result = _copy_file(src, dst_dir)
 
+	expected_dst = os.path.join(dst_dir, "file0")
+	assert result == expected_dst
+	assert fake_windows_copy.calls == [(str(src), expected_dst, None, None, None, 0)]
+
+
+def test_copy_file_windows_symlink_flag(tmp_path, fake_windows_copy):
+	"""Test that follow_symlinks=False asks CopyFileExW to copy the symlink itself."""
+	src = tmp_path / "file0"
+	dst = tmp_path / "copy_of_file0"
+
+	result = _copy_file(src, dst, follow_symlinks=False)
+
+	assert result == dst
+	assert fake_windows_copy.calls == [(str(src), str(dst), None, None, None, 0x800)]
 
-def test_load_save_existing_save_without_rm(tmp_path, capsys):
-	"""Test loading backup when current save exists without rm flag."""
-	backup_path = tmp_path / "backups" / "test_backup"
-	backup_path.mkdir(parents=True)
-	(backup_path / "file0").write_text("backup save data")
 
-	game_save_dir = tmp_path / "game_save"
-	game_save_dir.mkdir()
-	(game_save_dir / "file0").write_text("current save")
+def test_copy_file_windows_failure(tmp_path, fake_windows_copy):
+	"""Test that a failed CopyFileExW call raises."""
+	fake_windows_copy.result = 0
 
-	with patch("undertale_manager.GAME_SAVE_DIR", game_save_dir):
-		load_save(backup_path, rm=False)
+	with pytest.raises(OSError, match="CopyFileExW failed"):
+		_copy_file(tmp_path / "file0", tmp_path / "copy_of_file0")
 
-	# Original should remain unchanged
-	assert (game_save_dir / "file0").read_text() == "current save"
 
-	captured = capsys.readouterr()
-	assert "Current save exists" in captured.out
+@pytest.fixture(params=["plain", "symlinked"])
+def stale_game_save_dir(request, tmp_path):
+	"""Game save directory holding a save plus stale extra files, either directly or through a symlink.
+	The files themselves always live in `tmp_path / "real_game_save"`.
+	"""
+	real_dir = tmp_path / "real_game_save"
+	_make_dirs(real_dir / "stale_dir")
+	(real_dir / "file0").write_bytes(b"old save")
+	(real_dir / "file9").write_bytes(b"old system info")
+	(real_dir / "stale_dir" / "stale_file").write_bytes(b"stale")
 
+	if request.param == "plain":
+		return real_dir
 
-def test_load_save_existing_save_with_rm(tmp_path, capsys):
-	"""Test loading backup when current save exists with rm flag."""
+	save_dir = tmp_path / "game_save"
+	try:
+		save_dir.symlink_to(real_dir, target_is_directory=True)
+	except OSError:  # Windows needs admin rights or Developer Mode for symlinks
+		pytest.skip("symlinks not available")
+	return save_dir
+
+
+def test_load_save_with_rm_clears_stale_files(tmp_path, stale_game_save_dir, monkeypatch, printed):
+	"""Test that loading with rm leaves no files from the old save behind, even through a symlinked save dir."""
 	backup_path = tmp_path / "backups" / "test_backup"
-	backup_path.mkdir(parents=True)
-	(backup_path / "file0").write_text("backup save data")
+	_make_dirs(backup_path)
+	(backup_path / "file0").write_bytes(b"backup save data")
+
+	monkeypatch.setattr("undertale_manager.GAME_SAVE_DIR", stale_game_save_dir)
+	load_save(backup_path, rm=True)
+
+	real_dir = tmp_path / "real_game_save"
+	assert sorted(item.name for item in real_dir.iterdir()) == ["file0"]
+	assert (real_dir / "file0").read_bytes() == b"backup save data"
+
+
+def test_backup_save_with_rm_clears_stale_files(tmp_path, stale_game_save_dir, monkeypatch, printed):
+	"""Test that backing up with rm empties the save dir, even through a symlink."""
+	monkeypatch.setattr("undertale_manager.GAME_SAVE_DIR", stale_game_save_dir)
+	backup_save("test_backup", tmp_path / "backups", rm=True)
+
+	assert list((tmp_path / "real_game_save").iterdir()) == []
+	assert (tmp_path / "backups" / "test_backup" / "file9").read_bytes() == b"old system info"
+
+
+def test_clear_game_save_dir_propagates_errors(tmp_path, stale_game_save_dir, monkeypatch):
+	"""Test that a file that can't be removed (e.g. locked by the running game) raises instead of being skipped."""
+	def locked_unlink(path, *args, **kwargs):
+		raise PermissionError(f"{path} is locked")
+
+	monkeypatch.setattr("undertale_manager.GAME_SAVE_DIR", stale_game_save_dir)
+	monkeypatch.setattr("undertale_manager.os.unlink", locked_unlink)
+
+	with pytest.raises(PermissionError):
+		backup_save("test_backup", tmp_path / "backups", rm=True)
+
+
+@pytest.mark.parametrize(
+	("backup_exists", "current_save", "rm", "expected_files", "expected_message"),
+	[
+		pytest.param(
+			True, False, False,
+			{"file0": b"backup save data", "file9": b"system info"},
+			"Backup 'test_backup' loaded",
+			id="load",
+		),
+		pytest.param(
+			False, False, False,
+			{"file0": None},
+			"does not exist",
+			id="nonexistent",
+		),
+		pytest.param(
+			True, True, False,
+			{"file0": b"save data", "undertale.ini": b"config", "file9": None},  # Original should remain unchanged
+			"Current save exists",
+			id="existing_save_without_rm",
+		),
+		pytest.param(
+			True, True, True,
+			{"file0": b"backup save data", "file9": b"system info", "undertale.ini": None},  # Old files removed
+			"Backup 'test_backup' loaded",
+			id="existing_save_with_rm",
+		),
+	],
+)
+def test_load_save(tmp_path, request, monkeypatch, printed, backup_exists, current_save, rm, expected_files, expected_message):
+	"""Test loading a save from backup, with and without a current save in the way."""
+	backup_path = tmp_path / "backups" / "test_backup"
+	if backup_exists:
+		_make_dirs(backup_path)
+		(backup_path / "file0").write_bytes(b"backup save data")
+		(backup_path / "file9").write_bytes(b"system info")
+
+	if current_save:
+		game_save_dir = request.getfixturevalue("game_save_dir")
+	else:
+		game_save_dir = tmp_path / "game_save"
+		game_save_dir.mkdir()
 
-	game_save_dir = tmp_path / "game_save"
-	game_save_dir.mkdir()
-	(game_save_dir / "file0").write_text("current save")
-	(game_save_dir / "old_file").write_text("old data")
+	monkeypatch.setattr("undertale_manager.GAME_SAVE_DIR", game_save_dir)
+	load_save(backup_path, rm=rm)
 
-	with patch("undertale_manager.GAME_SAVE_DIR", game_save_dir):
-		load_save(backup_path, rm=True)
+	for name, content in expected_files.items():
+		if content is None:
+			assert not (game_save_dir / name).exists()
+		else:
+			assert (game_save_dir / name).read_bytes() == content
 
-	# Old files should be removed and new ones loaded
-	assert (game_save_dir / "file0").read_text() == "backup save data"
-	assert not (game_save_dir / "old_file").exists()
+	if current_save:
+		# The canonical game save must not be touched through the links
+		canonical_game_save = request.getfixturevalue("_canonical_game_save")
+		assert (canonical_game_save / "file0").read_bytes() == b"save data"
+		assert (canonical_game_save / "undertale.ini").exists()
 
-	captured = capsys.readouterr()
-	assert "Backup 'test_backup' loaded" in captured.out
+	assert _was_printed(printed, expected_message)
 
 
 # Room IDs Tests
@@ -387,3 +628,22 @@ def test_room_ids_lookup():
 	# Error room
 	room = ROOM_IDS[0]
 	assert room["area"] == "ERROR"
+
+
+# TUI Tests
+
+def test_refresh_save_list_right_after_another(tmp_path):
+	"""Test that a refresh requested right after another one still shows the newest backups."""
+	backup_dir = tmp_path / "backups"
+	_make_dirs(backup_dir / "backup1")
+
+	async def run():
+		app = UndertaleManagerApp(backup_dir)
+		async with app.run_test() as pilot:
+			app.refresh_save_list()
+			(backup_dir / "backup2").mkdir()  # e.g. created by `backup_save` before the next refresh
+			app.refresh_save_list()
+			await pilot.pause()
+			return sorted(widget.save.TITLE for widget in app.query(SaveWidget))
+
+	assert asyncio.run(run()) == ["backup1", "backup2"]